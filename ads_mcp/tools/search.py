@@ -61,10 +61,11 @@ def search(
 
     final_output: List = []
     for batch in query_result:
-        for row in batch.results:
-            final_output.append(
-                utils.format_output_row(row, batch.field_mask.paths)
+        final_output.extend(
+            utils.format_output_rows(
+                list(batch.results), batch.field_mask.paths
             )
+        )
     return final_output
 
 
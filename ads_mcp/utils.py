@@ -15,11 +15,17 @@
 """Common utilities used by the MCP server."""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
+import base64
+import functools
+import keyword
 import logging
+import operator
 import os
+import sys
 import importlib.resources
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 import proto
 from google.ads.googleads.client import GoogleAdsClient
@@ -32,10 +38,8 @@ from ads_mcp.mcp_header_interceptor import MCPHeaderInterceptor
 
 try:
     from google.protobuf.message import Message as ProtobufMessage
-    from google.protobuf.json_format import MessageToDict
 except Exception:  # pragma: no cover
     ProtobufMessage = None  # type: ignore
-    MessageToDict = None  # type: ignore
 
 # filename for generated field information used by search
 _GAQL_FILENAME = "gaql_resources.json"
@@ -103,14 +107,29 @@ def _get_or_create_client() -> GoogleAdsClient:
     return _googleads_client
 
 
+# Single interceptor shared by all services; it holds no per-call state.
+_INTERCEPTOR = MCPHeaderInterceptor()
+
+
+@functools.lru_cache(maxsize=None)
 def get_googleads_service(serviceName: str) -> GoogleAdsServiceClient:
-    return _get_or_create_client().get_service(serviceName, interceptors=[MCPHeaderInterceptor()])
+    return _get_or_create_client().get_service(
+        serviceName, interceptors=[_INTERCEPTOR]
+    )
 
 
+# Not memoized: get_type returns a fresh message instance that callers
+# mutate (e.g. update_references sets request.query on it).
 def get_googleads_type(typeName: str):
     return _get_or_create_client().get_type(typeName)
 
 
+# Memoized verdicts of _is_repeated_container, keyed by value type. Ads
+# responses reuse the same handful of container types, so after the first
+# row the check is a single dict lookup.
+_REPEATED_TYPE_CACHE: dict[type, bool] = {}
+
+
 def _is_repeated_container(value: Any) -> bool:
     """
     Detect protobuf repeated containers, including upb-backed containers that
@@ -125,11 +144,22 @@ def _is_repeated_container(value: Any) -> bool:
     if isinstance(value, Mapping):
         return False
 
-    # proto.Message is handled separately (it serializes to dict via ListFields)
+    # proto.Message is handled separately (it serializes to a dict of fields)
     if isinstance(value, proto.Message):
         return False
 
     t = type(value)
+    cached = _REPEATED_TYPE_CACHE.get(t)
+    if cached is not None:
+        return cached
+
+    result = _is_repeated_container_slow(t)
+    _REPEATED_TYPE_CACHE[t] = result
+    return result
+
+
+def _is_repeated_container_slow(t: type) -> bool:
+    """Uncached type inspection backing _is_repeated_container."""
     mod = getattr(t, "__module__", "") or ""
     name = getattr(t, "__name__", "") or ""
 
@@ -141,15 +171,23 @@ def _is_repeated_container(value: Any) -> bool:
 
     # Fallback: sequence protocol support
     # Many containers implement __len__ and __getitem__ even if __iter__ isn't obvious.
-    if hasattr(value, "__iter__"):
+    if hasattr(t, "__iter__"):
         return True
 
-    if hasattr(value, "__len__") and hasattr(value, "__getitem__"):
+    if hasattr(t, "__len__") and hasattr(t, "__getitem__"):
         return True
 
     return False
 
 
+_MISSING = object()
+
+# Resolved attribute names per (object type, requested name), so the
+# reserved-word fallbacks below are probed once per type instead of paying
+# for swallowed AttributeErrors on every access.
+_FIELD_NAME_CACHE: dict[tuple[type, str], str] = {}
+
+
 def _get_attr_with_reserved_fallback(obj: Any, name: str) -> Any:
     """
     Proto-plus sometimes exposes reserved proto field names with a trailing underscore
@@ -158,37 +196,240 @@ def _get_attr_with_reserved_fallback(obj: Any, name: str) -> Any:
     if obj is None:
         raise AttributeError(name)
 
-    try:
-        return getattr(obj, name)
-    except Exception:
-        pass
-
-    try:
-        return getattr(obj, f"{name}_")
-    except Exception:
-        pass
+    key = (type(obj), name)
+    resolved = _FIELD_NAME_CACHE.get(key)
+    if resolved is not None:
+        return getattr(obj, resolved)
 
+    candidates = [name, f"{name}_"]
     if name.endswith("_"):
-        try:
-            return getattr(obj, name[:-1])
-        except Exception:
-            pass
+        candidates.append(name[:-1])
+
+    for candidate in candidates:
+        value = getattr(obj, candidate, _MISSING)
+        if value is not _MISSING:
+            _FIELD_NAME_CACHE[key] = candidate
+            return value
 
     raise AttributeError(name)
 
 
+# Split-and-interned path tuples keyed by the original dotted string, so a
+# path is parsed once per query rather than once per row and field.
+_PATH_PARTS: dict[str, tuple[str, ...]] = {}
+
+
+def _split_path(path: str) -> tuple[str, ...]:
+    """Returns the cached, interned segments of a dotted attribute path."""
+    parts = _PATH_PARTS.get(path)
+    if parts is None:
+        parts = tuple(sys.intern(p) for p in path.split("."))
+        _PATH_PARTS[path] = parts
+    return parts
+
+
+def _get_nested_by_parts(obj: Any, parts: tuple[str, ...]) -> Any:
+    """Walks pre-split path segments with the reserved-word fallback."""
+    cur = obj
+    for part in parts:
+        cur = _get_attr_with_reserved_fallback(cur, part)
+    return cur
+
+
 def get_nested_attr_safe(obj: Any, path: str) -> Any:
     """
     Safe nested attribute getter that supports proto-plus reserved-word suffixing.
     Example: 'ad_group_ad.ad.type' will successfully resolve to Python attr 'type_'.
     """
-    cur = obj
-    for part in path.split("."):
-        cur = _get_attr_with_reserved_fallback(cur, part)
-    return cur
-
+    return _get_nested_by_parts(obj, _split_path(path))
+
+
+# Types format_output_value returns unchanged. Checked by exact type up
+# front, so common scalar fields skip the isinstance chain entirely. Exact
+# type matters: proto-plus enums subclass int but must not take this path.
+_SCALAR_TYPES = frozenset({int, float, str, bool, type(None)})
+
+
+# Cached {int value: name} tables per proto-plus enum class, so converting an
+# enum member is a dict lookup instead of a descriptor walk behind .name.
+_ENUM_NAME_CACHE: dict[type, dict[int, str]] = {}
+
+
+# Field kinds a serialization plan dispatches on, resolved at plan build.
+_KIND_SCALAR = 0
+_KIND_MESSAGE = 1
+_KIND_ENUM = 2
+_KIND_MESSAGE_LIST = 3
+_KIND_SCALAR_LIST = 4
+_KIND_ENUM_LIST = 5
+_KIND_SCALAR_MAP = 6
+_KIND_MESSAGE_MAP = 7
+
+# Field plans for proto-plus message types. Each plan is a tuple of
+# (name, has_presence, kind, enum_names) resolved once per type, so
+# serializing a message iterates the plan instead of paying a ListFields()
+# descriptor walk and tuple allocation per call. Sub-messages are read from
+# the underlying protobuf message and recurse through _pb_to_dict directly,
+# staying on the raw C-backed objects instead of re-entering the proto-plus
+# wrapper's attribute machinery.
+_PLAN_CACHE: dict[type, tuple] = {}
+
+
+def _build_field_plan(descriptor: Any) -> tuple:
+    """Resolves a message descriptor's fields into a serialization plan."""
+    plan = []
+    for field in descriptor.fields:
+        enum_names = None
+        is_map = (
+            field.type == field.TYPE_MESSAGE
+            and field.message_type.GetOptions().map_entry
+        )
+        if is_map:
+            val_field = field.message_type.fields_by_name["value"]
+            if val_field.type == val_field.TYPE_MESSAGE:
+                kind = _KIND_MESSAGE_MAP
+            else:
+                kind = _KIND_SCALAR_MAP
+        elif field.is_repeated:
+            if field.type == field.TYPE_MESSAGE:
+                kind = _KIND_MESSAGE_LIST
+            elif field.type == field.TYPE_ENUM:
+                kind = _KIND_ENUM_LIST
+            else:
+                kind = _KIND_SCALAR_LIST
+        elif field.type == field.TYPE_MESSAGE:
+            kind = _KIND_MESSAGE
+        elif field.type == field.TYPE_ENUM:
+            kind = _KIND_ENUM
+        else:
+            kind = _KIND_SCALAR
+        if kind in (_KIND_ENUM, _KIND_ENUM_LIST):
+            enum_names = {ev.number: ev.name for ev in field.enum_type.values}
+        plan.append((field.name, field.has_presence, kind, enum_names))
+    return tuple(plan)
+
+
+# Generated per-descriptor serializers for raw protobuf messages. Each entry
+# is a function specialized to one message type, so converting a message is
+# straight-line attribute reads instead of reflection over its descriptor.
+_DICT_BUILDER_CACHE: dict[Any, Callable[[Any], Any]] = {}
+
+
+def _pb_to_dict(msg: Any) -> Any:
+    """Converts a raw protobuf message to a dict of its set fields."""
+    descriptor = msg.DESCRIPTOR
+    builder = _DICT_BUILDER_CACHE.get(descriptor)
+    if builder is None:
+        builder = _compile_dict_builder(descriptor)
+        _DICT_BUILDER_CACHE[descriptor] = builder
+    return builder(msg)
+
+
+def _compile_dict_builder(descriptor: Any) -> Callable[[Any], Any]:
+    """
+    Generate a serializer specialized to one message descriptor.
 
-def format_output_value(value: Any) -> Any:
+    Field names, kinds and presence rules are resolved once here, at build
+    time, and compiled into a function whose body is straight-line attribute
+    reads — no per-call descriptor walks or name mangling. Output matches
+    json_format.MessageToDict(preserving_proto_field_name=True): only set
+    fields appear, enums become their value names, bytes are base64-encoded.
+    """
+    # AdTextAsset collapses to its text, matching format_output_value.
+    if descriptor.name == "AdTextAsset":
+        return operator.attrgetter("text")
+
+    namespace: dict[str, Any] = {
+        "_pb_to_dict": _pb_to_dict,
+        "_b64": base64.b64encode,
+    }
+    lines = ["def _to_dict(msg):", "    out = {}"]
+    for i, field in enumerate(descriptor.fields):
+        name = field.name
+        if name.isidentifier() and not keyword.iskeyword(name):
+            ref = f"msg.{name}"
+        else:
+            ref = f"getattr(msg, {name!r})"
+
+        if field.type == field.TYPE_ENUM:
+            namespace[f"_enum_{i}"] = {
+                ev.number: ev.name for ev in field.enum_type.values
+            }
+
+        is_map = (
+            field.type == field.TYPE_MESSAGE
+            and field.message_type.GetOptions().map_entry
+        )
+        if is_map:
+            val_field = field.message_type.fields_by_name["value"]
+            lines.append(f"    v = {ref}")
+            lines.append("    if v:")
+            if val_field.type == val_field.TYPE_MESSAGE:
+                lines.append(
+                    f"        out[{name!r}] ="
+                    " {k: _pb_to_dict(x) for k, x in v.items()}"
+                )
+            else:
+                lines.append(f"        out[{name!r}] = dict(v)")
+        elif field.is_repeated:
+            lines.append(f"    v = {ref}")
+            lines.append("    if v:")
+            if field.type == field.TYPE_MESSAGE:
+                lines.append(
+                    f"        out[{name!r}] = [_pb_to_dict(x) for x in v]"
+                )
+            elif field.type == field.TYPE_ENUM:
+                lines.append(
+                    f"        out[{name!r}] = [_enum_{i}.get(x, x) for x in v]"
+                )
+            elif field.type == field.TYPE_BYTES:
+                lines.append(
+                    f"        out[{name!r}] ="
+                    " [_b64(x).decode('ascii') for x in v]"
+                )
+            else:
+                lines.append(f"        out[{name!r}] = list(v)")
+        elif field.type == field.TYPE_MESSAGE:
+            lines.append(f"    if msg.HasField({name!r}):")
+            lines.append(f"        out[{name!r}] = _pb_to_dict({ref})")
+        else:
+            if field.has_presence:
+                lines.append(f"    if msg.HasField({name!r}):")
+                lines.append(f"        v = {ref}")
+            else:
+                lines.append(f"    v = {ref}")
+                lines.append("    if v:")
+            if field.type == field.TYPE_ENUM:
+                lines.append(f"        out[{name!r}] = _enum_{i}.get(v, v)")
+            elif field.type == field.TYPE_BYTES:
+                lines.append(f"        out[{name!r}] = _b64(v).decode('ascii')")
+            else:
+                lines.append(f"        out[{name!r}] = v")
+    lines.append("    return out")
+
+    exec(
+        compile(
+            "\n".join(lines),
+            f"<ads_mcp dict builder for {descriptor.full_name}>",
+            "exec",
+        ),
+        namespace,
+    )
+    return namespace["_to_dict"]
+
+
+def format_output_value(
+    value: Any,
+    # Keyword-only bindings of hot globals, so the per-field dispatch below
+    # runs on LOAD_FAST instead of LOAD_GLOBAL. Not part of the public API.
+    *,
+    _type=type,
+    _isinstance=isinstance,
+    _scalar_types=_SCALAR_TYPES,
+    _proto_enum=proto.Enum,
+    _proto_message=proto.Message,
+    _mapping=Mapping,
+) -> Any:
     """
     Convert Google Ads / proto-plus / protobuf objects to JSON-serializable primitives.
 
@@ -199,57 +440,74 @@ def format_output_value(value: Any) -> Any:
       - proto.Message / protobuf Message -> dict recursively
     """
     try:
-        if value is None:
-            return None
+        # Fast path: plain scalars (and None) pass through untouched.
+        if _type(value) in _scalar_types:
+            return value
 
         # proto-plus enums
-        if isinstance(value, proto.Enum):
-            return value.name
+        if _isinstance(value, _proto_enum):
+            t = _type(value)
+            names = _ENUM_NAME_CACHE.get(t)
+            if names is None:
+                names = {int(m): m.name for m in t}
+                _ENUM_NAME_CACHE[t] = names
+            name = names.get(int(value))
+            return name if name is not None else value.name
 
         # RSA asset objects (headlines/descriptions list items)
         # Convert each AdTextAsset to plain text.
-        tname = type(value).__name__
+        tname = _type(value).__name__
         if tname == "AdTextAsset" and hasattr(value, "text"):
             return getattr(value, "text")
 
         # Dict-like
-        if isinstance(value, Mapping):
-            return {str(k): format_output_value(v) for k, v in value.items()}
+        fmt = format_output_value
+        if _isinstance(value, _mapping):
+            return {str(k): fmt(v) for k, v in value.items()}
 
         # Protobuf repeated containers / list-like objects
         if _is_repeated_container(value):
-            return [format_output_value(v) for v in value]
+            return [fmt(v) for v in value]
 
         # proto-plus messages
-        if isinstance(value, proto.Message):
-            pb = getattr(value, "_pb", None)
-            if pb is not None and hasattr(pb, "ListFields"):
-                out: dict[str, Any] = {}
-                for field_desc, field_val in pb.ListFields():
-                    out[field_desc.name] = format_output_value(field_val)
-                return out
-
-            # Fallback: best-effort scan
+        if _isinstance(value, _proto_message):
+            pb = value._pb
+            plan = _PLAN_CACHE.get(_type(value))
+            if plan is None:
+                plan = _build_field_plan(pb.DESCRIPTOR)
+                _PLAN_CACHE[_type(value)] = plan
+            to_dict = _pb_to_dict
             out: dict[str, Any] = {}
-            for attr in dir(value):
-                if attr.startswith("_"):
-                    continue
-                try:
-                    v = getattr(value, attr)
-                except Exception:
-                    continue
-                if callable(v):
-                    continue
-                out[attr] = format_output_value(v)
+            for name, has_presence, kind, enum_names in plan:
+                if has_presence:
+                    if not pb.HasField(name):
+                        continue
+                    v = getattr(pb, name)
+                else:
+                    v = getattr(pb, name)
+                    if not v:
+                        continue
+                if kind == _KIND_SCALAR:
+                    out[name] = v
+                elif kind == _KIND_MESSAGE:
+                    out[name] = to_dict(v)
+                elif kind == _KIND_ENUM:
+                    out[name] = enum_names.get(v, v)
+                elif kind == _KIND_MESSAGE_LIST:
+                    out[name] = [to_dict(x) for x in v]
+                elif kind == _KIND_SCALAR_LIST:
+                    out[name] = list(v)
+                elif kind == _KIND_ENUM_LIST:
+                    out[name] = [enum_names.get(x, x) for x in v]
+                elif kind == _KIND_SCALAR_MAP:
+                    out[name] = dict(v)
+                else:
+                    out[name] = {k: to_dict(x) for k, x in v.items()}
             return out
 
         # protobuf messages (raw protobuf types)
-        if (
-            ProtobufMessage is not None
-            and isinstance(value, ProtobufMessage)
-            and MessageToDict is not None
-        ):
-            return MessageToDict(value, preserving_proto_field_name=True)
+        if ProtobufMessage is not None and _isinstance(value, ProtobufMessage):
+            return _pb_to_dict(value)
 
         # Basic scalars
         return value
@@ -262,12 +520,51 @@ def format_output_value(value: Any) -> Any:
         return str(value)
 
 
+# Compiled accessors for nested attribute paths, keyed by (row type, path).
+# Building an accessor resolves the proto-plus reserved-name fallback once, so
+# subsequent rows of the same type use a single C-level attrgetter call instead
+# of re-splitting the path and retrying getattr per segment.
+_ACCESSOR_CACHE: dict[tuple[type, str], Callable[[Any], Any]] = {}
+
+
+def _build_accessor(sample_row: Any, path: str) -> Callable[[Any], Any]:
+    """
+    Compile an attribute path into a single callable, resolved against a
+    sample row. Each segment picks whichever of 'name', 'name_' or 'name'
+    minus its trailing underscore actually exists (the same fallbacks as
+    _get_attr_with_reserved_fallback), and the resolved names are baked into
+    an operator.attrgetter.
+    """
+    cur = sample_row
+    real_parts: list[str] = []
+    for part in _split_path(path):
+        candidates = [part, f"{part}_"]
+        if part.endswith("_"):
+            candidates.append(part[:-1])
+        for candidate in candidates:
+            value = getattr(cur, candidate, _MISSING)
+            if value is not _MISSING:
+                real_parts.append(candidate)
+                cur = value
+                break
+        else:
+            raise AttributeError(part)
+    return operator.attrgetter(".".join(real_parts))
+
+
 def format_output_row(row: Any, attributes: list[str]) -> dict[str, Any]:
+    # Local bindings keep the per-field loop on LOAD_FAST.
+    cache = _ACCESSOR_CACHE
+    fmt = format_output_value
     out: dict[str, Any] = {}
+    row_type = type(row)
     for attr in attributes:
         try:
-            raw_val = get_nested_attr_safe(row, attr)
-            out[attr] = format_output_value(raw_val)
+            accessor = cache.get((row_type, attr))
+            if accessor is None:
+                accessor = _build_accessor(row, attr)
+                cache[(row_type, attr)] = accessor
+            out[attr] = fmt(accessor(row))
         except Exception:
             try:
                 logger.exception("Failed to extract field '%s'", attr)
@@ -277,6 +574,33 @@ def format_output_row(row: Any, attributes: list[str]) -> dict[str, Any]:
     return out
 
 
+# Row counts below this are formatted serially; thread-pool startup would
+# cost more than it saves.
+_PARALLEL_ROW_THRESHOLD = 256
+
+
+def format_output_rows(
+    rows: list, attributes: list[str], workers: int = 4
+) -> list[dict[str, Any]]:
+    """
+    Format a list of rows, fanning out to a thread pool for large result
+    sets. Row formatting spends much of its time in protobuf C calls, and
+    the caches it relies on are plain dicts whose single-key updates are
+    atomic under the GIL, so rows can be processed concurrently.
+    """
+    if len(rows) < _PARALLEL_ROW_THRESHOLD:
+        return [format_output_row(row, attributes) for row in rows]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda row: format_output_row(row, attributes),
+                rows,
+                chunksize=max(1, len(rows) // (workers * 4)),
+            )
+        )
+
+
 def get_gaql_resources_filepath():
     package_root = importlib.resources.files("ads_mcp")
     return package_root.joinpath(_GAQL_FILENAME)
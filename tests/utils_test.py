@@ -18,6 +18,9 @@ import unittest
 from google.ads.googleads.v21.enums.types.campaign_status import (
     CampaignStatusEnum,
 )
+from google.ads.googleads.v21.services.types.google_ads_service import (
+    GoogleAdsRow,
+)
 
 from ads_mcp import utils
 
@@ -28,10 +31,50 @@ class TestUtils(unittest.TestCase):
     def test_format_output_value(self):
         """Tests that output values are formatted correctly."""
 
-        client = utils.get_googleads_client()
         self.assertEqual(
             utils.format_output_value(
                 CampaignStatusEnum.CampaignStatus.ENABLED
             ),
             "ENABLED",
         )
+
+    def test_format_output_value_raw_protobuf(self):
+        """Tests that raw protobuf messages serialize to dicts of set fields."""
+
+        row = GoogleAdsRow()
+        row.campaign.name = "Test Campaign"
+        row.campaign.status = CampaignStatusEnum.CampaignStatus.PAUSED
+
+        self.assertEqual(
+            utils.format_output_value(row._pb),
+            {"campaign": {"name": "Test Campaign", "status": "PAUSED"}},
+        )
+
+    def test_format_output_row(self):
+        """Tests that rows are formatted using compiled field accessors."""
+
+        row = GoogleAdsRow()
+        row.campaign.name = "Test Campaign"
+        row.campaign.status = CampaignStatusEnum.CampaignStatus.PAUSED
+
+        self.assertEqual(
+            utils.format_output_row(row, ["campaign.name", "campaign.status"]),
+            {
+                "campaign.name": "Test Campaign",
+                "campaign.status": "PAUSED",
+            },
+        )
+
+    def test_format_output_rows_parallel(self):
+        """Tests that large row lists format identically via the thread pool."""
+
+        rows = []
+        for i in range(utils._PARALLEL_ROW_THRESHOLD + 1):
+            row = GoogleAdsRow()
+            row.campaign.name = f"Campaign {i}"
+            rows.append(row)
+
+        formatted = utils.format_output_rows(rows, ["campaign.name"])
+
+        self.assertEqual(len(formatted), len(rows))
+        self.assertEqual(formatted[-1], {"campaign.name": f"Campaign {i}"})